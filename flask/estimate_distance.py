@@ -1,5 +1,3 @@
-import numpy as np
-
 def estimate_distance(power_received, params=None):
     """This function returns an estimated distance range
        given a single radio signal strength (RSS) reading
@@ -37,7 +35,7 @@ def estimate_distance(power_received, params=None):
     d_min = d_ref*(10**(-(power_received - power_ref + uncertainty)/(10*path_loss_exp)))
     d_max = d_ref*(10**(-(power_received - power_ref - uncertainty)/(10*path_loss_exp)))
 
-    return (np.round(d_est,2), np.round(d_min,2), np.round(d_max,2))
+    return (round(d_est,2), round(d_min,2), round(d_max,2))
 
 
 # # example usage, for testing
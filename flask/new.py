@@ -1,13 +1,19 @@
-from flask import Flask, request, jsonify
-from flask_socketio import SocketIO
+import signal
+import threading
+
+# Set by SIGUSR1. The handler goes in before the heavy imports so that a standby
+# promoted while still booting is not killed by the default SIGUSR1 action.
+promoted = threading.Event()
+if __name__ == '__main__' and hasattr(signal, 'SIGUSR1'):
+    signal.signal(signal.SIGUSR1, lambda signum, frame: promoted.set())
+
+from flask import Flask, request, jsonify, current_app
+import argparse
 import logging
 import math
-from wall import particle_filter_localization, a_star, heuristic
+from wall import a_star
 from estimate_distance import estimate_distance
 
-app = Flask(__name__)
-socketio = SocketIO(app, cors_allowed_origins="*")
-
 logging.basicConfig(level=logging.INFO)
 
 latest_results = {}
@@ -52,8 +58,24 @@ graph = {
 # Initialize node congestion
 node_congestion = {node: 0 for node in graph['nodes']}
 
+def build_exit_index(graph):
+    """Precompute, for every node, the exits sorted by straight-line distance."""
+    index = {}
+    for node, data in graph['nodes'].items():
+        user_coords = data['coords']
+        exit_distances = {}
+        for exit in active_exits.keys():
+            exit_coords = graph['nodes'][exit]['coords']
+            exit_distances[exit] = math.sqrt((exit_coords[0] - user_coords[0])**2 +
+                                             (exit_coords[1] - user_coords[1])**2)
+        index[node] = [exit for exit, _ in sorted(exit_distances.items(), key=lambda x: x[1])]
+    return index
+
+# Exits ordered by straight-line distance for every node
+exit_index = build_exit_index(graph)
+
 def send_update():
-    socketio.emit("update", {
+    current_app.extensions['socketio'].emit("update", {
         "devices": list(latest_results.values()),
         "exits": active_exits,
         "congestion": node_congestion,
@@ -62,19 +84,9 @@ def send_update():
     })
 
 def find_nearest_available_exit(user_node, blocked_nodes):
-    exit_distances = {}
-    for exit in active_exits.keys():
+    for exit in exit_index[user_node]:
         if exit in blocked_nodes:
             continue
-        user_coords = graph['nodes'][user_node]['coords']
-        exit_coords = graph['nodes'][exit]['coords']
-        distance = math.sqrt((exit_coords[0] - user_coords[0])**2 + 
-                            (exit_coords[1] - user_coords[1])**2)
-        exit_distances[exit] = distance
-    
-    sorted_exits = sorted(exit_distances.items(), key=lambda x: x[1])
-    
-    for exit, _ in sorted_exits:
         if len(active_exits[exit]) < EXIT_CAPACITY[exit]:
             path, _ = a_star(graph, user_node, exit, blocked_nodes)
             if path:
@@ -175,7 +187,6 @@ def determine_nearest_node(coordinate, graph):
     
     return nearest_node
 
-@app.route("/fire", methods=["POST"])
 def update_fire():
     global fire_nodes
     data = request.get_json()
@@ -186,7 +197,6 @@ def update_fire():
         return jsonify({"status": "success"}), 200
     return jsonify({"status": "failure"}), 400
 
-@app.route("/", methods=["POST"])
 def process_wifi_data():
     global latest_results, active_exits, node_congestion
     try:
@@ -244,7 +254,6 @@ def process_wifi_data():
         logging.error(f"Error: {str(e)}")
         return jsonify({'status': 'failure', 'message': str(e)}), 500
 
-@app.route('/exit/<device_tag>', methods=['POST'])
 def free_exit(device_tag):
     global latest_results, active_exits, node_congestion
     if device_tag in latest_results:
@@ -264,11 +273,9 @@ def free_exit(device_tag):
         return jsonify({'status': 'success'}), 200
     return jsonify({'status': 'failure'}), 400
 
-@socketio.on("connect")
 def handle_connect():
     send_update()
 
-@app.route("/update", methods=["GET"])
 def send_map_update():
     return jsonify({
         "graph": graph,
@@ -276,7 +283,6 @@ def send_map_update():
         "fire_nodes": list(fire_nodes),
     })
 
-@app.route('/get_updates', methods=['GET'])
 def get_updates():
     return jsonify({
         "devices": list(latest_results.values()),
@@ -284,5 +290,51 @@ def get_updates():
         "graph": graph
     })
 
+def create_app():
+    """Build the Flask app with Socket.IO attached as app.extensions['socketio']."""
+    from flask_socketio import SocketIO
+
+    app = Flask(__name__)
+    socketio = SocketIO(app, cors_allowed_origins="*")
+
+    app.add_url_rule("/fire", view_func=update_fire, methods=["POST"])
+    app.add_url_rule("/", view_func=process_wifi_data, methods=["POST"])
+    app.add_url_rule('/exit/<device_tag>', view_func=free_exit, methods=['POST'])
+    app.add_url_rule("/update", view_func=send_map_update, methods=["GET"])
+    app.add_url_rule('/get_updates', view_func=get_updates, methods=['GET'])
+    socketio.on_event("connect", handle_connect)
+    return app
+
+def warm_up(app):
+    """Serve one request in-process so the first real client doesn't pay for it."""
+    app.test_client().get('/update')
+
+def wait_for_promotion():
+    """Block a warm standby until it receives SIGUSR1, which may already have arrived."""
+    if not promoted.is_set():
+        logging.info("Warm standby ready, send SIGUSR1 to start serving")
+        promoted.wait()
+    logging.info("Promoted from standby, starting server")
+
 if __name__ == '__main__':
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Evacuation routing server")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--debug', action='store_true', help="Enable debug mode and the reloader")
+    parser.add_argument('--standby', action='store_true', help="Boot and warm up, then wait for SIGUSR1 before serving")
+    parser.add_argument('--allow-unsafe-werkzeug', action='store_true',
+                        help="Serve with the Werkzeug development server when stdin is not a TTY")
+    args = parser.parse_args()
+    if args.standby and args.debug:
+        # The reloader serves from a child process that SIGUSR1 would never reach
+        parser.error("--standby cannot be combined with --debug")
+    if args.standby and not hasattr(signal, 'SIGUSR1'):
+        parser.error("--standby needs SIGUSR1, which this platform does not support")
+
+    app = create_app()
+    if args.standby:
+        # Boot time is hidden while on standby, so spend it warming up
+        warm_up(app)
+        wait_for_promotion()
+    app.extensions['socketio'].run(app, host=args.host, port=args.port, debug=args.debug,
+                                   allow_unsafe_werkzeug=args.allow_unsafe_werkzeug)